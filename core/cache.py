@@ -0,0 +1,111 @@
+import time
+from functools import wraps
+from typing import Any, Callable, Dict, List
+
+from cachetools import LRUCache
+
+from core.kernel import _request_var_get
+
+
+def cacheable(ttl: float = 60.0):
+    """
+    Mark a route handler's responses as cacheable by ResponseCacheMiddleware.
+
+    The decorator records the TTL in the request scope while the handler runs,
+    so the outermost cache middleware knows to store the response it just
+    forwarded. Routes without the marker are never cached.
+
+    Args:
+        ttl: How long, in seconds, a cached response stays fresh.
+
+    Returns:
+        A decorator wrapping the route handler.
+    """
+
+    def decorator(fn: Callable):
+        @wraps(fn)
+        async def wrapper(*args, **kwargs):
+            result = await fn(*args, **kwargs)
+            # Marked only once the handler has returned, so a raised
+            # HTTPException (or any other error) never flags the response
+            # for storage.
+            request = _request_var_get()
+            if request is not None:
+                request.scope["cache_ttl"] = ttl
+            return result
+
+        return wrapper
+
+    return decorator
+
+
+# Request headers a response may legitimately vary by; their values are part
+# of the cache key so entries are never served across clients that negotiate
+# different content or carry different credentials.
+_VARY_HEADERS = frozenset(
+    {b"accept", b"accept-encoding", b"accept-language", b"authorization", b"cookie"}
+)
+
+
+class ResponseCacheMiddleware:
+    """
+    Pure ASGI middleware that serves repeat GET/HEAD responses from memory.
+
+    Responses of routes marked with @cacheable are stored as their raw ASGI
+    messages in an in-process LRU with per-entry TTL. On a hit the captured
+    messages are replayed directly and the rest of the middleware stack and
+    the handler never run; everything else passes through untouched.
+
+    Args:
+        app: The downstream ASGI application.
+        max_size: Maximum number of cached responses before LRU eviction.
+    """
+
+    def __init__(self, app, max_size: int = 1024):
+        self.app = app
+        # key -> (expires_at, captured ASGI messages). LRU ordering and
+        # eviction are handled by the cache itself, so the request path does
+        # no manual move_to_end/popitem bookkeeping.
+        self._cache: "LRUCache" = LRUCache(maxsize=max_size)
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["method"] not in ("GET", "HEAD"):
+            await self.app(scope, receive, send)
+            return
+
+        key = (
+            scope["method"],
+            scope["path"],
+            scope["query_string"],
+            tuple(sorted((k, v) for k, v in scope["headers"] if k in _VARY_HEADERS)),
+        )
+        cache = self._cache
+        now = time.monotonic()
+        entry = cache.get(key)
+        if entry is not None:
+            expires_at, messages = entry
+            if expires_at > now:
+                for message in messages:
+                    await send(message)
+                return
+            del cache[key]
+
+        captured: List[Dict[str, Any]] = []
+
+        async def send_wrapper(message):
+            captured.append(message)
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
+
+        # Set by the @cacheable route marker after the handler returned.
+        # Only successful responses are stored; caching an error for the
+        # full TTL would keep serving it after the route recovers.
+        ttl = scope.get("cache_ttl")
+        if (
+            ttl
+            and captured
+            and captured[0]["type"] == "http.response.start"
+            and 200 <= captured[0]["status"] < 300
+        ):
+            cache[key] = (now + ttl, captured)
@@ -1,24 +1,53 @@
+import logging
+
 from fastapi import Request
 from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
 from starlette.responses import Response
 
+logger = logging.getLogger(__name__)
+
 
 async def simple_middleware(
     request: Request, call_next: RequestResponseEndpoint, tag: str = "DEFAULT"
 ) -> Response:
-    print(f"[simple_middleware] Before request with tag={tag}")
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(f"[simple_middleware] Before request with tag={tag}")
     response = await call_next(request)
-    print("[simple_middleware] After request")
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("[simple_middleware] After request")
     return response
 
 
-async def middleware_with_header(
-    request: Request, call_next: RequestResponseEndpoint
-) -> Response:
-    token = request.headers.get("X-Custom-Token", "No-Token")
-    print(f"[middleware_with_header] Token: {token}")
-    response = await call_next(request)
-    return response
+def _token_from_raw_headers(raw_headers) -> str:
+    # ASGI servers already lowercase header names, so a single pass over the
+    # raw (bytes, bytes) tuples is enough — no Headers multidict needed.
+    for name, value in raw_headers:
+        if name == b"x-custom-token":
+            return value.decode("latin-1")
+    return "No-Token"
+
+
+class MiddlewareWithHeader:
+    """Pure ASGI middleware that reads X-Custom-Token from the raw header list."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        token = _token_from_raw_headers(scope["headers"])
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"[middleware_with_header] Token: {token}")
+        await self.app(scope, receive, send)
+
+    async def dispatch(self, request: Request, call_next: RequestResponseEndpoint):
+        # Route-level path: same raw scan, over the request's scope.
+        token = _token_from_raw_headers(request.scope["headers"])
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"[middleware_with_header] Token: {token}")
+        return await call_next(request)
 
 
 class CustomClassMiddleware(BaseHTTPMiddleware):
@@ -29,9 +58,11 @@ class CustomClassMiddleware(BaseHTTPMiddleware):
     async def dispatch(
         self, request: Request, call_next: RequestResponseEndpoint
     ) -> Response:
-        print(f"[CustomClassMiddleware] Hello from {self.name}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"[CustomClassMiddleware] Hello from {self.name}")
         response = await call_next(request)
-        print(f"[CustomClassMiddleware] Bye from {self.name}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"[CustomClassMiddleware] Bye from {self.name}")
         return response
 
 
@@ -41,7 +72,11 @@ class RawASGIMiddleware:
         self.label = label
 
     async def __call__(self, scope, receive, send):
-        print(
-            f"[RawASGIMiddleware] Request path: {scope['path']} - label: {self.label}"
-        )
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                f"[RawASGIMiddleware] Request path: {scope['path']} - label: {self.label}"
+            )
         await self.app(scope, receive, send)
@@ -1,12 +1,16 @@
+import asyncio
 import contextvars
 import importlib
-import inspect
-from functools import wraps
+import sys
+from functools import lru_cache, partial, wraps
+from inspect import CO_COROUTINE
+from types import FunctionType, MappingProxyType
 from typing import Any, Awaitable, Callable, Dict, List, Optional, Type, Union
 
 from fastapi import FastAPI, Request
 from starlette.middleware import Middleware as StarletteMiddleware
 from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.responses import Response, StreamingResponse
 
 MiddlewareRef = Union[
     str,  # name or import path
@@ -18,21 +22,46 @@ MiddlewareRef = Union[
 # Constants defining module paths for named middlewares and middleware stack.
 NAMED_MIDDLEWARES_MODULE = "core.middleware_registry.NAMED_MIDDLEWARES"
 MIDDLEWARE_STACK_MODULE = "core.middlewares.middlewares"
+MIDDLEWARE_GROUPS_MODULE = "core.middlewares.middlewares_by_group"
 
-# Global registry to store named middleware references.
-MIDDLEWARE_REGISTRY: Dict[str, MiddlewareRef] = {}
+# Global registry to store named middleware references. Writes go through
+# register_named_middleware into the private dict, with keys interned so
+# lookups compare by pointer; the public name is a read-only view.
+_MIDDLEWARE_REGISTRY: Dict[str, MiddlewareRef] = {}
+MIDDLEWARE_REGISTRY: "MappingProxyType[str, MiddlewareRef]" = MappingProxyType(
+    _MIDDLEWARE_REGISTRY
+)
 
 # Global variable to hold the FastAPI application instance.
 _internal_app: Optional[FastAPI] = None
 
-# Context variable to store the current request object for access within middleware.
-_request_var = contextvars.ContextVar("request_var")
+# Default priority for middlewares that do not declare one. Lower values run
+# earlier (closer to the outside of the stack).
+DEFAULT_MIDDLEWARE_PRIORITY = 100
+
+# Context variable to store the current request object for access within
+# middleware. The None default lets readers call get() with no argument,
+# skipping the per-call sentinel handling of get(None).
+_request_var = contextvars.ContextVar("request_var", default=None)
+
+# Bound methods cached once, avoiding the attribute lookup per request.
+_request_var_get = _request_var.get
+_request_var_set = _request_var.set
+_request_var_reset = _request_var.reset
+
+
+# Memoized results of _import_string, keyed by dotted path.
+_IMPORT_CACHE: Dict[str, Any] = {}
 
 
 def _import_string(path: str) -> Any:
     """
     Import a Python object from a dotted string path.
 
+    Results are memoized in _IMPORT_CACHE, and already-imported modules are
+    fetched from sys.modules without touching importlib, so repeat
+    resolutions cost a dict probe and never contend on the import lock.
+
     Args:
         path: A string representing the import path (e.g., "module.submodule.Class").
 
@@ -42,12 +71,35 @@ def _import_string(path: str) -> Any:
     Raises:
         ImportError: If the path cannot be resolved or the object cannot be imported.
     """
+    obj = _IMPORT_CACHE.get(path)
+    if obj is not None:
+        return obj
     try:
         module_path, attr = path.rsplit(".", 1)
-        module = importlib.import_module(module_path)
-        return getattr(module, attr)
+        module = sys.modules.get(module_path) or importlib.import_module(module_path)
+        obj = getattr(module, attr)
     except (ImportError, AttributeError, ValueError) as e:
         raise ImportError(f"Could not import '{path}': {e}") from e
+    _IMPORT_CACHE[path] = obj
+    return obj
+
+
+def _is_coroutine_fn(fn: Any) -> bool:
+    """
+    Check whether a callable is an async function via its code-object flags.
+
+    Reads CO_COROUTINE straight off fn.__code__, skipping the wrapper
+    unwrapping and markcoroutinefunction bookkeeping that
+    inspect.iscoroutinefunction performs on every call.
+
+    Args:
+        fn: The callable to check.
+
+    Returns:
+        bool: True if fn was defined with `async def`, False otherwise.
+    """
+    code = getattr(fn, "__code__", None)
+    return code is not None and bool(code.co_flags & CO_COROUTINE)
 
 
 def _is_asgi_middleware(cls: Any) -> bool:
@@ -61,14 +113,341 @@ def _is_asgi_middleware(cls: Any) -> bool:
     Returns:
         bool: True if the class is an ASGI middleware, False otherwise.
     """
+    # Direct type test plus an MRO scan for an actual __call__ definition;
+    # every class is "callable" through its metaclass, so getattr-based
+    # probing says nothing about instances being ASGI callables.
     return (
-        inspect.isclass(cls)
-        and callable(getattr(cls, "__call__", None))
+        isinstance(cls, type)
         and not issubclass(cls, BaseHTTPMiddleware)
+        and any("__call__" in c.__dict__ for c in cls.__mro__[:-1])
     )
 
 
-def _resolve_middleware(
+class HeadersView:
+    """
+    Lightweight, read-only view over the raw ASGI header list.
+
+    Provides the dict-like get() that header-reading middlewares need,
+    scanning the (bytes, bytes) tuples in scope["headers"] directly instead
+    of building Starlette's Headers structure.
+    """
+
+    __slots__ = ("_raw",)
+
+    def __init__(self, raw_headers):
+        self._raw = raw_headers
+
+    def get(self, name: str, default: Optional[str] = None) -> Optional[str]:
+        target = name.lower().encode("latin-1")
+        for key, value in self._raw:
+            if key == target:
+                return value.decode("latin-1")
+        return default
+
+    def __contains__(self, name: str) -> bool:
+        return self.get(name) is not None
+
+
+class _HeadersOnlyRequest:
+    """Minimal request stand-in passed to header-only function middlewares."""
+
+    __slots__ = ("scope", "headers")
+
+    def __init__(self, scope, receive=None):
+        self.scope = scope
+        self.headers = HeadersView(scope["headers"])
+
+
+def headers_only(fn: Callable) -> Callable:
+    """
+    Mark a function middleware as reading only request headers.
+
+    Marked functions receive a lightweight stand-in backed by HeadersView
+    instead of a full Starlette Request, skipping the Request allocation on
+    every call. The marker is the only way onto this fast path: detecting
+    header-only functions from their code objects cannot tell a request
+    attribute from any other name, so a function touching request.app or
+    request.base_url could be misclassified and fail at request time.
+
+    Args:
+        fn: The middleware function to mark. It must touch nothing on the
+            request beyond .headers and .scope.
+
+    Returns:
+        The same function, tagged for the function-middleware adapter.
+    """
+    fn._headers_only = True
+    return fn
+
+
+# Source templates for the generated dispatch functions, keyed by whether the
+# wrapped function takes call_next. The emitted code is branch-free: fn is
+# bound in the exec namespace, so each call is a plain awaited invocation.
+_DISPATCH_TEMPLATES = {
+    True: (
+        "async def dispatch_fn(self, request, call_next):\n"
+        "    return await fn(request, call_next, **self.kwargs)\n"
+    ),
+    False: (
+        "async def dispatch_fn(self, request, call_next):\n"
+        "    await fn(request, **self.kwargs)\n"
+        "    return await call_next(request)\n"
+    ),
+}
+
+
+def _compile_dispatch(fn: Callable, expects_call_next: bool) -> Callable:
+    """
+    Compile a specialized dispatch function for a wrapped middleware function.
+
+    The template matching the function's shape is compiled once per wrap with
+    fn bound in the namespace, so the resulting dispatch carries no
+    introspection or conditional branch at request time.
+
+    Args:
+        fn: The middleware function to bind.
+        expects_call_next: Whether fn takes a call_next parameter.
+
+    Returns:
+        The generated async dispatch function.
+    """
+    namespace: Dict[str, Any] = {"fn": fn}
+    exec(
+        compile(
+            _DISPATCH_TEMPLATES[expects_call_next],
+            f"<dispatch for {fn.__name__}>",
+            "exec",
+        ),
+        namespace,
+    )
+    return namespace["dispatch_fn"]
+
+
+@lru_cache(maxsize=512)
+def _fn_profile(fn: Callable):
+    """
+    Compute the per-function middleware profile, once per function.
+
+    The profile carries everything _FuncASGIMiddleware needs that depends
+    only on the function itself: whether it takes call_next (read straight
+    from the code object), which request factory to use (HeadersView-backed
+    stand-in for functions explicitly marked @headers_only), and the
+    compiled dispatch.
+
+    Args:
+        fn: The middleware function.
+
+    Returns:
+        A (expects_call_next, request_cls, dispatch_fn) tuple.
+    """
+    code = fn.__code__
+    expects_call_next = "call_next" in code.co_varnames[: code.co_argcount]
+    request_cls = (
+        _HeadersOnlyRequest if getattr(fn, "_headers_only", False) else Request
+    )
+    return expects_call_next, request_cls, _compile_dispatch(fn, expects_call_next)
+
+
+class _FuncASGIMiddleware:
+    """
+    Shared pure ASGI adapter for function-style middlewares.
+
+    One module-level class serves every wrapped function: the function and
+    its precomputed profile are bound per instance, so resolving a function
+    middleware no longer allocates a fresh type object and MRO. Non-HTTP
+    scopes are forwarded untouched; the per-shape run method is selected once
+    in __init__, keeping the request path branch-free. Functions without
+    call_next are observe-only: they run before the downstream app and cannot
+    replace the response.
+    """
+
+    __slots__ = ("app", "fn", "kwargs", "_request_cls", "_run", "_dispatch")
+
+    def __init__(self, app, fn: Callable = None, **kwargs):
+        self.app = app
+        self.fn = fn
+        self.kwargs = kwargs
+        expects_call_next, self._request_cls, self._dispatch = _fn_profile(fn)
+        self._run = self._run_streaming if expects_call_next else self._run_observing
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        await self._run(scope, receive, send)
+
+    async def _run_streaming(self, scope, receive, send):
+        app_task: asyncio.Task = None
+        disconnected = asyncio.Event()
+
+        async def wrapped_receive():
+            message = await receive()
+            if message["type"] == "http.disconnect":
+                disconnected.set()
+            return message
+
+        async def response_receive():
+            # The response's disconnect listener runs concurrently with the
+            # downstream app, which reads the request body from the same
+            # channel; a second reader here would steal http.request
+            # messages. Report disconnects seen by the body reads instead of
+            # racing on receive().
+            await disconnected.wait()
+            return {"type": "http.disconnect"}
+
+        request = self._request_cls(scope, wrapped_receive)
+
+        async def call_next(request: Request) -> Response:
+            nonlocal app_task
+            # Run the downstream app concurrently and hand back a streaming
+            # response as soon as http.response.start arrives, mirroring
+            # BaseHTTPMiddleware. Buffering the whole body here would delay
+            # first-byte time, hold large responses in memory, and never
+            # return at all for infinite streams (e.g. SSE). The queue is
+            # bounded so the producer is backpressured chunk by chunk rather
+            # than running ahead of the client.
+            queue: asyncio.Queue = asyncio.Queue(maxsize=1)
+
+            async def run_app():
+                try:
+                    await self.app(scope, wrapped_receive, queue.put)
+                finally:
+                    await queue.put(None)
+
+            task = app_task = asyncio.create_task(run_app())
+
+            message = await queue.get()
+            if message is None:
+                # Downstream finished without a response; awaiting the task
+                # re-raises whatever took it down.
+                await task
+                raise RuntimeError("No response returned.")
+
+            async def body_stream():
+                try:
+                    # Drain to the sentinel (not just the last body chunk) so
+                    # the producer's final put is always consumed.
+                    while True:
+                        body_message = await queue.get()
+                        if body_message is None:
+                            break
+                        if body_message["type"] == "http.response.body":
+                            body = body_message.get("body", b"")
+                            if body:
+                                yield body
+                    await task
+                finally:
+                    # Client went away mid-stream: stop the producer instead
+                    # of leaving it blocked on the bounded queue.
+                    if not task.done():
+                        task.cancel()
+
+            response = StreamingResponse(body_stream(), status_code=message["status"])
+            response.raw_headers = list(message.get("headers", []))
+            return response
+
+        try:
+            response = await self.fn(request, call_next, **self.kwargs)
+            await response(scope, response_receive, send)
+        finally:
+            # The middleware awaited call_next but then raised or returned a
+            # different response: body_stream was never iterated, so its
+            # cleanup never ran and the producer would sit on the bounded
+            # queue forever.
+            if app_task is not None and not app_task.done():
+                app_task.cancel()
+
+    async def _run_observing(self, scope, receive, send):
+        # Observe-only: no call_next, so the downstream response is forwarded
+        # directly without capturing messages.
+        await self.fn(self._request_cls(scope, receive), **self.kwargs)
+        await self.app(scope, receive, send)
+
+    async def dispatch(self, request, call_next):
+        return await self._dispatch(self, request, call_next)
+
+    def __repr__(self):
+        return f"<_FuncASGIMiddleware {self.fn.__name__}>"
+
+    def __str__(self):
+        return f"_FuncASGIMiddleware({self.fn.__name__})"
+
+
+def asgi_middleware(fn: Callable) -> Callable:
+    """
+    Mark a function middleware as written directly against the ASGI interface.
+
+    Marked functions take (app, scope, receive, send, **kwargs) and call the
+    downstream app themselves, so the adapter adds nothing per request — no
+    Request construction, no response capture. This is the fastest shape for
+    hot-path middlewares that work on the raw scope and messages.
+
+    Args:
+        fn: The async middleware function to mark.
+
+    Returns:
+        The same function, tagged for the function-middleware adapter.
+    """
+    fn._asgi_middleware = True
+    return fn
+
+
+class _RawFuncASGIMiddleware:
+    """
+    Zero-overhead adapter for @asgi_middleware functions.
+
+    Forwards every scope straight into the function with the downstream app
+    bound first; the function owns HTTP filtering and calling onwards.
+    """
+
+    __slots__ = ("app", "fn", "kwargs")
+
+    def __init__(self, app, fn: Callable = None, **kwargs):
+        self.app = app
+        self.fn = fn
+        self.kwargs = kwargs
+
+    async def __call__(self, scope, receive, send):
+        await self.fn(self.app, scope, receive, send, **self.kwargs)
+
+    def __repr__(self):
+        return f"<_RawFuncASGIMiddleware {self.fn.__name__}>"
+
+
+@lru_cache(maxsize=512)
+def _make_func_middleware(fn: Callable) -> Callable:
+    """
+    Build the middleware factory for a function ref.
+
+    Returns a partial binding fn into the shared adapter matching its shape:
+    @asgi_middleware functions get the raw passthrough adapter, everything
+    else the Request/call_next-style _FuncASGIMiddleware. Callers invoke the
+    factory exactly like a middleware class (factory(app, **kwargs)).
+    Memoized so the same function always yields the same factory.
+
+    Args:
+        fn: The middleware function, with signature (request, call_next, **kwargs)
+            or (request, **kwargs) — or (app, scope, receive, send, **kwargs)
+            when marked with @asgi_middleware.
+
+    Raises:
+        ValueError: If fn is not an async function.
+
+    Returns:
+        A factory producing adapter instances bound to fn.
+    """
+    if not _is_coroutine_fn(fn):
+        # Fail at registration: a sync function would hand back an un-awaited
+        # coroutine (or block the loop) on the first request instead.
+        raise ValueError(
+            f"Function middleware '{fn.__name__}' must be an async function"
+        )
+    if getattr(fn, "_asgi_middleware", False):
+        return partial(_RawFuncASGIMiddleware, fn=fn)
+    return partial(_FuncASGIMiddleware, fn=fn)
+
+
+def _resolve_middleware_uncached(
     ref: MiddlewareRef,
 ) -> Union[Callable, Type[BaseHTTPMiddleware], Type[Any]]:
     """
@@ -76,8 +455,8 @@ def _resolve_middleware(
 
     This function converts a middleware reference (string, function, or class)
     into a form that can be used by Starlette's middleware system. Functions are
-    wrapped in a BaseHTTPMiddleware subclass, while classes are validated as either
-    BaseHTTPMiddleware or ASGI middleware.
+    wrapped in a pure ASGI middleware class, while classes are validated as
+    either BaseHTTPMiddleware or ASGI middleware.
 
     Args:
         ref: The middleware reference (string path, function, or class).
@@ -90,32 +469,27 @@ def _resolve_middleware(
     """
     cls_or_func: Union[Callable, Type[BaseHTTPMiddleware], Type[Any]] = ref
     if isinstance(ref, str):
-        if ref in MIDDLEWARE_REGISTRY:
-            cls_or_func = MIDDLEWARE_REGISTRY.get(ref)
+        # Registry keys are interned on write; interning the lookup key too
+        # lets the dict probe succeed on identity without rehashing.
+        ref = sys.intern(ref)
+        if ref not in _MIDDLEWARE_REGISTRY:
+            # A miss may just mean the named-middleware module hasn't been
+            # loaded yet — e.g. core.middlewares imported on its own, whose
+            # Middleware("raw_asgi", ...) entries resolve at import time.
+            # Load it before falling back to treating ref as an import path.
+            _load_named_middlewares()
+        if ref in _MIDDLEWARE_REGISTRY:
+            cls_or_func = _MIDDLEWARE_REGISTRY.get(ref)
         else:
             cls_or_func = _import_string(ref)
 
     if isinstance(cls_or_func, str):
         cls_or_func = _import_string(cls_or_func)
 
-    if inspect.isfunction(cls_or_func):
-        # Wrap a middleware function in a BaseHTTPMiddleware subclass
-        class FuncMiddleware(BaseHTTPMiddleware):
-            def __init__(self, app, **kwargs):
-                super().__init__(app)
-                self.kwargs = kwargs
-
-            async def dispatch(self, request, call_next):
-                return await cls_or_func(request, call_next, **self.kwargs)
-
-            def __repr__(self):
-                return f"<FuncMiddleware {cls_or_func.__name__}>"
-
-            def __str__(self):
-                return f"FuncMiddleware({cls_or_func.__name__})"
-
-        return FuncMiddleware
-    elif inspect.isclass(cls_or_func):
+    if isinstance(cls_or_func, FunctionType):
+        # Wrap a middleware function in a pure ASGI middleware class
+        return _make_func_middleware(cls_or_func)
+    elif isinstance(cls_or_func, type):
         if issubclass(cls_or_func, BaseHTTPMiddleware) or _is_asgi_middleware(
             cls_or_func
         ):
@@ -129,45 +503,58 @@ def _resolve_middleware(
     raise ValueError(f"MiddlewareRef invalide : {ref} (type={type(ref)})")
 
 
-def register_named_middleware(name: str, ref: MiddlewareRef, *, override: bool = False):
+_resolve_middleware_cached = lru_cache(maxsize=512)(_resolve_middleware_uncached)
+
+
+def _resolve_middleware(
+    ref: MiddlewareRef,
+) -> Union[Callable, Type[BaseHTTPMiddleware], Type[Any]]:
     """
-    Register a middleware class or import path under a given name in the registry.
+    Resolve a MiddlewareRef, memoizing the result for hashable refs.
+
+    Strings, functions, and classes — the common cases — all hash, so repeat
+    resolutions are a single lru_cache probe. Unhashable refs fall back to
+    the uncached path.
 
     Args:
-        name: The name to associate with the middleware.
         ref: The middleware reference (string path, function, or class).
-        override: If True, allows overwriting an existing middleware with the same name.
+
+    Returns:
+        A middleware class (BaseHTTPMiddleware or ASGI) or a wrapped function.
 
     Raises:
-        ValueError: If the name is already registered and override is False.
+        ValueError: If the middleware reference is invalid or unsupported.
     """
-    if name in MIDDLEWARE_REGISTRY and not override:
-        raise ValueError(f"Middleware '{name}' already registered.")
-    MIDDLEWARE_REGISTRY[name] = ref
+    try:
+        return _resolve_middleware_cached(ref)
+    except TypeError:
+        return _resolve_middleware_uncached(ref)
 
 
-def _get_awaitable_fn(fn) -> Awaitable[Any]:
+def register_named_middleware(name: str, ref: MiddlewareRef, *, override: bool = False):
     """
-    Wrap a function to ensure it is awaitable, supporting both sync and async functions.
+    Register a middleware class or import path under a given name in the registry.
 
     Args:
-        fn: The function to wrap.
+        name: The name to associate with the middleware.
+        ref: The middleware reference (string path, function, or class).
+        override: If True, allows overwriting an existing middleware with the same name.
 
-    Returns:
-        A wrapped function that is awaitable.
+    Raises:
+        ValueError: If the name is already registered and override is False.
     """
-
-    @wraps(fn)
-    def wrapper(*args, **kwargs):
-        if inspect.iscoroutinefunction(fn):
-            return fn(*args, **kwargs)
-        else:
-            return fn(*args, **kwargs)
-
-    return wrapper
+    name = sys.intern(name)
+    if name in _MIDDLEWARE_REGISTRY and not override:
+        raise ValueError(f"Middleware '{name}' already registered.")
+    _MIDDLEWARE_REGISTRY[name] = ref
+    # The memoized resolver may hold the previous binding for this name (or
+    # an import-path fallback for it); drop it so the next resolution sees
+    # the new ref. lru_cache has no per-key eviction, but registration is a
+    # startup-time event, so a full clear is fine.
+    _resolve_middleware_cached.cache_clear()
 
 
-def route_middleware(ref: MiddlewareRef, **kwargs: Any):
+def route_middleware(ref: MiddlewareRef, *, per_request: bool = False, **kwargs: Any):
     """
     Decorator to apply a middleware to a specific FastAPI route.
 
@@ -176,47 +563,98 @@ def route_middleware(ref: MiddlewareRef, **kwargs: Any):
 
     Args:
         ref: The middleware reference (string path, function, or class).
+        per_request: If True, construct a fresh middleware instance per
+            request instead of reusing one built at decoration time. Only
+            needed for middlewares that keep per-request state on themselves.
         **kwargs: Additional keyword arguments to pass to the middleware.
 
     Returns:
         A decorator function that wraps the route handler.
 
     Raises:
-        RuntimeError: If the FastAPI app is not initialized or RequestContextMiddleware is missing.
+        RuntimeError: If the FastAPI app is not initialized or OrchestrationMiddleware is missing.
         ValueError: If the middleware is invalid or unsupported for route-level application.
     """
-    global _internal_app
     cls = _resolve_middleware(ref)
 
     def decorator(route_handler: Callable):
+        # Captured as closure locals so the per-request path loads them from
+        # cells instead of re-resolving module globals on every hit.
+        get_request = _request_var_get
+
         if not _internal_app:
             raise RuntimeError(
                 "Middleware can only be applied after the FastAPI app is created."
             )
 
-        awaitable_route_handler = _get_awaitable_fn(route_handler)
-        mw_kwargs = kwargs.copy()
+        if _is_coroutine_fn(route_handler):
+            awaitable_route_handler = route_handler
+        else:
+            # Decided once at decoration time: sync handlers run in the
+            # default executor so they never block the event loop.
+            async def awaitable_route_handler(*args, **route_kwargs):
+                return await asyncio.get_running_loop().run_in_executor(
+                    None, partial(route_handler, *args, **route_kwargs)
+                )
 
-        @wraps(route_handler)
-        async def wrapped_handler(*args, **route_kwargs):
-            request = _request_var.get(None)
+        # Branch on the middleware kind once at decoration time and bind the
+        # matching handler closure, so the request path contains no
+        # issubclass/hasattr checks at all. Function refs resolve to partial
+        # factories over the shared adapter, so unwrap those first.
+        if hasattr(getattr(cls, "func", cls), "dispatch"):
+            if per_request:
+                # Opt-in for middlewares that keep per-request state on the
+                # instance: rebuild it on every request from a prebound
+                # factory (keyword unpacking is paid once, here).
+                factory = partial(cls, _internal_app, **kwargs)
 
-            if request is None:
-                raise RuntimeError(
-                    "Request context not found. Ensure RequestContextMiddleware is registered."
-                )
+                @wraps(route_handler)
+                async def wrapped_handler(*args, **route_kwargs):
+                    request = get_request()
+
+                    if request is None:
+                        raise RuntimeError(
+                            "Request context not found. Ensure OrchestrationMiddleware is registered."
+                        )
 
-            async def call_next(request: Request):
-                return await awaitable_route_handler(*args, **route_kwargs)
+                    async def call_next(request: Request):
+                        return await awaitable_route_handler(*args, **route_kwargs)
+
+                    return await factory().dispatch(request, call_next)
+
+            else:
+                # Instantiate once; _internal_app and the kwargs never change
+                # afterwards (kwargs are only unpacked here, so no defensive
+                # copy is needed). BaseHTTPMiddleware subclasses and function
+                # wrappers both expose dispatch().
+                dispatch = cls(_internal_app, **kwargs).dispatch
 
-            if issubclass(cls, BaseHTTPMiddleware):
-                instance = cls(_internal_app, **mw_kwargs)
-                return await instance.dispatch(request, call_next)
-            elif _is_asgi_middleware(cls):
+                @wraps(route_handler)
+                async def wrapped_handler(*args, **route_kwargs):
+                    request = get_request()
+
+                    if request is None:
+                        raise RuntimeError(
+                            "Request context not found. Ensure OrchestrationMiddleware is registered."
+                        )
+
+                    async def call_next(request: Request):
+                        return await awaitable_route_handler(*args, **route_kwargs)
+
+                    return await dispatch(request, call_next)
+
+        elif _is_asgi_middleware(getattr(cls, "func", cls)):
+
+            @wraps(route_handler)
+            async def wrapped_handler(*args, **route_kwargs):
                 raise ValueError(
                     "ASGI middleware is not yet supported for route-level usage."
                 )
-            else:
+
+        else:
+
+            @wraps(route_handler)
+            async def wrapped_handler(*args, **route_kwargs):
                 raise ValueError(
                     "Middleware must be a subclass of BaseHTTPMiddleware or an ASGI middleware."
                 )
@@ -226,10 +664,60 @@ def route_middleware(ref: MiddlewareRef, **kwargs: Any):
     return decorator
 
 
+class LazyMiddleware:
+    """
+    ASGI shim that defers construction of the wrapped middleware.
+
+    The real middleware is only instantiated on the first HTTP request that
+    reaches this layer, so middlewares with heavy __init__ work are never
+    built when an earlier middleware short-circuits every request (e.g. a
+    cache hit) or when the app never receives traffic at all.
+    """
+
+    def __init__(self, app, factory=None, **kwargs):
+        self.app = app
+        self._factory = factory
+        self._kwargs = kwargs
+        self._inner = None
+
+    async def __call__(self, scope, receive, send):
+        inner = self._inner
+        if inner is None:
+            inner = self._inner = self._factory(self.app, **self._kwargs)
+        await inner(scope, receive, send)
+
+    def __repr__(self):
+        return f"<LazyMiddleware factory={self._factory!r}>"
+
+
+def _registered_mw_classes(app: FastAPI) -> set:
+    """
+    Return the set of middleware classes registered on the app.
+
+    The set lives on app.state and is created lazily, seeded from whatever
+    app.user_middleware already holds, so middlewares added outside this
+    kernel (plain add_middleware calls) are still accounted for.
+
+    Args:
+        app: The FastAPI application instance.
+
+    Returns:
+        The mutable set of registered middleware classes.
+    """
+    classes = getattr(app.state, "_registered_mw_classes", None)
+    if classes is None:
+        classes = {middleware.cls for middleware in app.user_middleware}
+        app.state._registered_mw_classes = classes
+    return classes
+
+
 def _is_middleware_registered(app: FastAPI, middleware_class):
     """
     Check if a middleware class is already registered in the FastAPI app.
 
+    A set membership test against the per-app class set, rather than a
+    linear scan of app.user_middleware on every call.
+
     Args:
         app: The FastAPI application instance.
         middleware_class: The middleware class to check.
@@ -237,7 +725,115 @@ def _is_middleware_registered(app: FastAPI, middleware_class):
     Returns:
         bool: True if the middleware is registered, False otherwise.
     """
-    return any(middleware.cls == middleware_class for middleware in app.user_middleware)
+    return middleware_class in _registered_mw_classes(app)
+
+
+@lru_cache(maxsize=32)
+def _stack_for_group(stack: tuple, group: Optional[str]) -> tuple:
+    """
+    Prefilter, normalize, and order a middleware stack, cached per pair.
+
+    Group filtering only applies to Middleware entries; raw refs are always
+    kept, matching register_middlewares' historical behavior. Kept raw refs
+    (strings, functions, classes) are normalized into Middleware instances
+    here, so resolution happens once per (stack, group) pair and the
+    registration loop deals with a single entry shape. The result is sorted
+    in descending priority order (lowest priority value last, so it is added
+    last and ends up outermost), and memoized so repeat registrations with
+    the same stack and group cost a single cache probe.
+
+    Args:
+        stack: The middleware stack as a tuple.
+        group: Optional group name to filter Middleware entries by.
+
+    Returns:
+        The filtered stack of Middleware entries, ordered for registration.
+
+    Raises:
+        ValueError: If the stack contains an entry of an unsupported type.
+    """
+    if group is None:
+        entries = stack
+    else:
+        entries = (
+            m for m in stack if not isinstance(m, Middleware) or group in m.groups
+        )
+
+    normalized = []
+    for middleware in entries:
+        if isinstance(middleware, Middleware):
+            normalized.append(middleware)
+        elif isinstance(middleware, (str, Callable, type)):
+            normalized.append(Middleware(middleware))
+        else:
+            raise ValueError(f"Invalid middleware type: {type(middleware)}")
+
+    normalized.sort(key=lambda m: m.priority, reverse=True)
+    return tuple(normalized)
+
+
+# Whether NAMED_MIDDLEWARES has been loaded into the registry yet.
+_named_middlewares_loaded = False
+
+
+def _load_named_middlewares():
+    """
+    Load the NAMED_MIDDLEWARES module into the registry on first use.
+
+    Called on the first registry miss (and from register_middlewares), so
+    merely importing the kernel registers nothing. String refs are stored
+    as-is; _resolve_middleware imports them on first use, cached by
+    _import_string. The mapping lands in one dict.update — no per-key
+    Python loop, and the literal keys are already interned by the compiler
+    — but names the user registered beforehand are skipped rather than
+    clobbered, preserving register_named_middleware's collision semantics.
+    """
+    global _named_middlewares_loaded
+    if _named_middlewares_loaded:
+        return
+    _named_middlewares_loaded = True
+    registry = _MIDDLEWARE_REGISTRY
+    registry.update(
+        (name, ref)
+        for name, ref in _import_string(NAMED_MIDDLEWARES_MODULE).items()
+        if name not in registry
+    )
+
+
+def _freeze_middleware_stack(app: FastAPI):
+    """
+    Order the app's middleware stack and schedule its one-time build.
+
+    Pure ASGI middlewares are moved toward the outside of the stack and
+    BaseHTTPMiddleware-derived ones toward the inside (order is stable within
+    each kind), so the cheap passthrough layers run before any task-spawning
+    ones. The build itself runs from a startup hook rather than here:
+    assigning middleware_stack eagerly marks the app as started, which makes
+    later add_middleware calls raise and silently drops exception handlers
+    registered after register_middlewares — and the documented layout puts
+    register_middlewares right after FastAPI(), with everything else below.
+
+    Args:
+        app: The FastAPI application instance.
+    """
+
+    def _is_basehttp(middleware):
+        return isinstance(middleware.cls, type) and issubclass(
+            middleware.cls, BaseHTTPMiddleware
+        )
+
+    user_middleware = app.user_middleware
+    app.user_middleware = [
+        *(m for m in user_middleware if not _is_basehttp(m)),
+        *(m for m in user_middleware if _is_basehttp(m)),
+    ]
+
+    def _build_stack():
+        app.middleware_stack = app.build_middleware_stack()
+
+    if not getattr(app.state, "_mw_stack_freeze_scheduled", False):
+        app.state._mw_stack_freeze_scheduled = True
+        app.router.on_startup.append(_build_stack)
 
 
 def register_middlewares(app: FastAPI, group: Optional[str] = None):
@@ -245,7 +841,7 @@ def register_middlewares(app: FastAPI, group: Optional[str] = None):
     Register a stack of middlewares to a FastAPI application.
 
     This function loads a middleware stack from the MIDDLEWARE_STACK_MODULE and applies
-    the middlewares to the FastAPI app. It ensures RequestContextMiddleware is always
+    the middlewares to the FastAPI app. It ensures OrchestrationMiddleware is always
     registered first and supports middleware groups for conditional registration.
 
     Args:
@@ -255,86 +851,153 @@ def register_middlewares(app: FastAPI, group: Optional[str] = None):
     Raises:
         ValueError: If an invalid middleware type is encountered.
     """
+    # Imported here to avoid a module cycle (core.cache uses _request_var).
+    from core.cache import ResponseCacheMiddleware
+
     global _internal_app
     _internal_app = app
+    if group is not None:
+        # Match the interned group names stored on Middleware.groups, so the
+        # filter's membership tests compare by pointer.
+        group = sys.intern(group)
+    # Named middlewares must be in the registry before the stack module is
+    # imported, since its Middleware(...) entries may reference them by name.
+    _load_named_middlewares()
     stack: List["Middleware"] = _import_string(MIDDLEWARE_STACK_MODULE)
 
-    if not _is_middleware_registered(app, RequestContextMiddleware):
-        # Always register RequestContextMiddleware first
-        app.add_middleware(RequestContextMiddleware)
+    # Collect descriptors locally and splice them into app.user_middleware in
+    # one assignment, instead of N add_middleware calls mutating the list.
+    collected: List[StarletteMiddleware] = []
+
+    if not _is_middleware_registered(app, OrchestrationMiddleware):
+        # Always register the kernel's per-request layer first
+        collected.append(StarletteMiddleware(OrchestrationMiddleware))
+
+    # Group filtering, raw-ref normalization, and priority ordering are
+    # precomputed (and cached) per (stack, group) pair instead of re-run on
+    # every call; by now every entry is a Middleware with a resolved cls.
+    # When the stack module publishes a by-group index, its prefiltered
+    # tuple skips even the first filtering pass.
+    ordered = None
+    if group is not None:
+        try:
+            prefiltered = _import_string(MIDDLEWARE_GROUPS_MODULE).get(group)
+        except ImportError:
+            prefiltered = None
+        if prefiltered is not None:
+            ordered = _stack_for_group(prefiltered, None)
+    if ordered is None:
+        ordered = _stack_for_group(tuple(stack), group)
+
+    collected.extend(
+        StarletteMiddleware(LazyMiddleware, factory=m.cls, **m.kwargs)
+        if m.lazy
+        else StarletteMiddleware(m.cls, **m.kwargs)
+        for m in ordered
+    )
 
-    for middleware in stack:
-        if isinstance(middleware, Middleware):
-            if group is None or group in middleware.groups:
-                app.add_middleware(
-                    middleware.cls,
-                    **middleware.kwargs,
-                )
-        elif isinstance(middleware, (str, Callable, type)):
-            # Handle direct middleware references
-            cls = _resolve_middleware(middleware)
-            app.add_middleware(cls)
-        else:
-            raise ValueError(f"Invalid middleware type: {type(middleware)}")
+    if not _is_middleware_registered(app, ResponseCacheMiddleware):
+        # Added last so it wraps the whole stack; on a hit for a @cacheable
+        # route nothing below it (lazy middlewares included) ever runs.
+        collected.append(StarletteMiddleware(ResponseCacheMiddleware))
+
+    # add_middleware prepends, so later additions end up outermost; reversing
+    # the collected list reproduces that ordering in a single splice.
+    collected.reverse()
+    app.user_middleware = [*collected, *app.user_middleware]
+    _registered_mw_classes(app).update(m.cls for m in collected)
 
+    _freeze_middleware_stack(app)
 
-class Middleware(StarletteMiddleware):
+
+class Middleware:
     """
-    A wrapper class for Starlette middleware with additional group and naming support.
+    A wrapper class for Starlette-style middleware with group and naming support.
 
-    This class extends Starlette's Middleware to support middleware groups and named
-    registration. It resolves middleware references and allows associating middlewares
-    with specific groups for conditional application.
+    This class mirrors Starlette's Middleware interface (cls/args/kwargs and
+    tuple-style iteration) while adding middleware groups and named
+    registration. It is slotted rather than subclassing Starlette's class,
+    whose lack of __slots__ would force a per-instance __dict__; with the
+    auto-load loop creating many instances at startup, slots keep each one to
+    a fixed, compact layout.
 
     Attributes:
-        groups: List of group names this middleware belongs to.
+        cls: The resolved middleware class.
+        args: Positional arguments for the middleware (always empty here).
+        kwargs: Keyword arguments passed to the middleware constructor.
+        groups: Frozenset of group names this middleware belongs to.
         ref: The original middleware reference (string, function, or class).
+        lazy: Whether construction is deferred to the first HTTP request.
+        priority: Stack ordering; lower values end up further outside.
     """
 
+    __slots__ = ("cls", "args", "kwargs", "groups", "ref", "lazy", "priority")
+
     def __init__(
         self,
         ref: MiddlewareRef,
         *,
         middleware_groups: Optional[List[str]] = None,
         middleware_name: Optional[str] = None,
+        middleware_lazy: bool = False,
+        middleware_priority: int = DEFAULT_MIDDLEWARE_PRIORITY,
         **kwargs: Any,
     ):
-        cls = _resolve_middleware(ref)
-        super().__init__(cls, **kwargs)
-        self.groups = middleware_groups or []
+        self.cls = _resolve_middleware(ref)
+        self.args = ()
+        self.kwargs = kwargs
+        # Group names are a handful of constant strings repeated across
+        # declarations; interning them makes membership probes hit on
+        # pointer equality.
+        self.groups = frozenset(map(sys.intern, middleware_groups or ()))
         self.ref = ref
+        self.lazy = middleware_lazy
+        self.priority = middleware_priority
 
         if middleware_name:
             register_named_middleware(middleware_name, ref)
 
+    def __iter__(self):
+        # Starlette-compatible unpacking: (cls, args, kwargs).
+        return iter((self.cls, self.args, self.kwargs))
+
     def __repr__(self):
-        return (
-            f"<Middleware ref={self.ref} cls={self.cls.__name__} groups={self.groups}>"
-        )
+        # Function refs resolve to partial factories, which carry no __name__.
+        cls_name = getattr(self.cls, "__name__", repr(self.cls))
+        return f"<Middleware ref={self.ref} cls={cls_name} groups={self.groups}>"
 
 
-class RequestContextMiddleware(BaseHTTPMiddleware):
+class OrchestrationMiddleware:
+    """
+    Single pure ASGI layer carrying all kernel-owned per-request state.
+
+    The Request is stored both in scope["state"] (for consumers that hold the
+    scope) and in the _request_var context variable (for route_middleware's
+    wrapped handlers); any future kernel-level per-request setup belongs here
+    rather than in another stacked middleware, so the orchestration overhead
+    stays at one ASGI frame per request. Implemented directly against the
+    ASGI interface, so no BaseHTTPMiddleware task spawning or response
+    streaming is involved and the context variable propagates to the endpoint
+    in the same task.
     """
-    Middleware to store the current request in a context variable.
 
-    This middleware ensures that the current request is available in a context variable
-    (_request_var) for use by other middlewares or route handlers. It sets the request
-    at the start of processing and clears it afterward.
+    def __init__(self, app):
+        self.app = app
 
-    Methods:
-        dispatch: Handles storing and clearing the request context.
-    """
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
 
-    async def dispatch(self, request: Request, call_next):
-        token = _request_var.set(request)
+        request = Request(scope, receive)
+        scope.setdefault("state", {})["request"] = request
+        token = _request_var_set(request)
         try:
-            response = await call_next(request)
+            await self.app(scope, receive, send)
         finally:
-            _request_var.reset(token)
-        return response
+            _request_var_reset(token)
 
 
-# Auto-load all named middlewares from the registry module
-NAMED_MIDDLEWARES = _import_string(NAMED_MIDDLEWARES_MODULE)
-for name, ref in NAMED_MIDDLEWARES.items():
-    register_named_middleware(name, ref)
+# Historical name for the kernel's per-request layer, kept for callers that
+# registered or checked it directly.
+RequestContextMiddleware = OrchestrationMiddleware
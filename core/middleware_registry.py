@@ -1,13 +1,10 @@
-from starlette.middleware.cors import CORSMiddleware
-from starlette.middleware.gzip import GZipMiddleware
-from starlette.middleware.trustedhost import TrustedHostMiddleware
-
-from core.custom_middlewares import middleware_with_header
-
+# Named middlewares are declared as dotted import paths, not imported
+# objects: importing this module costs nothing, and each target module is
+# only loaded if its name is actually resolved (cached by _import_string).
 NAMED_MIDDLEWARES = {
-    "cors": CORSMiddleware,
-    "trusted_host": TrustedHostMiddleware,
-    "gzip": GZipMiddleware,
+    "cors": "starlette.middleware.cors.CORSMiddleware",
+    "trusted_host": "starlette.middleware.trustedhost.TrustedHostMiddleware",
+    "gzip": "starlette.middleware.gzip.GZipMiddleware",
     "raw_asgi": "core.custom_middlewares.RawASGIMiddleware",
-    "with_header": middleware_with_header,
+    "with_header": "core.custom_middlewares.MiddlewareWithHeader",
 }
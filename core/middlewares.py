@@ -1,14 +1,23 @@
+import logging
+from types import MappingProxyType
+
 from core.custom_middlewares import CustomClassMiddleware, simple_middleware
 from core.kernel import Middleware
 
+logger = logging.getLogger(__name__)
+
 
-def debug_logger(request, call_next):
-    print(f"[DEBUG] Request path: {request.url.path}")
-    response = call_next(request)
+async def debug_logger(request, call_next):
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(f"[DEBUG] Request path: {request.url.path}")
+    response = await call_next(request)
     return response
 
 
-middlewares = [
+# Frozen at import: entries resolve their middleware class on construction,
+# and the tuple never changes afterwards, so register_middlewares can reuse
+# it as a stable cache key.
+middlewares = (
     Middleware(
         simple_middleware,
         tag="TestTag",
@@ -31,4 +40,13 @@ middlewares = [
         middleware_groups=["debug", "api"],
         middleware_name="debug_logger",
     ),
-]
+)
+
+# Read-only group index computed once at import; register_middlewares pulls
+# a prefiltered tuple from here instead of rescanning the stack per group.
+middlewares_by_group = MappingProxyType(
+    {
+        group: tuple(m for m in middlewares if group in m.groups)
+        for group in {g for m in middlewares for g in m.groups}
+    }
+)
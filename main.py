@@ -1,6 +1,19 @@
+import logging
+import logging.handlers
+import queue
+
 from fastapi import FastAPI, Request
 from core.kernel import register_middlewares, route_middleware
 
+# Route log records through a queue so I/O happens on a background thread
+# instead of blocking the event loop.
+_log_queue: "queue.Queue" = queue.Queue(-1)
+_log_listener = logging.handlers.QueueListener(_log_queue, logging.StreamHandler())
+logging.basicConfig(handlers=[logging.handlers.QueueHandler(_log_queue)])
+_log_listener.start()
+
+logger = logging.getLogger(__name__)
+
 app = FastAPI()
 
 register_middlewares(app, group="api")
@@ -21,7 +34,8 @@ async def read_with_header(request: Request):
 @app.get("/class")
 @route_middleware("custom_class", name="Ovarion")
 async def with_class_middleware():
-    print("This route uses a class-based middleware")
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("This route uses a class-based middleware")
     return {"message": "Class-based middleware used"}
 
 
@@ -31,15 +45,18 @@ async def raw_asgi_middleware_test(whois: str = "Anonymous"):
     return {"message": "This route uses raw ASGI middleware", "whois": whois}
 
 async def direct_middleware(request: Request, call_next):
-    print(f"[Direct Middleware] Processing request for {request.url.path}")
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(f"[Direct Middleware] Processing request for {request.url.path}")
     response = await call_next(request)
-    print("[Direct Middleware] Response processed")
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("[Direct Middleware] Response processed")
     return response
 
 @app.post("/direct")
 @route_middleware(direct_middleware)
 async def direct_middleware_test():
-    print("This route uses a direct middleware function")
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("This route uses a direct middleware function")
     return {"message": "This route uses a direct middleware function"}
 
 